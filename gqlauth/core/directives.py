@@ -1,11 +1,13 @@
 import dataclasses
-from typing import Any, final
+from typing import TYPE_CHECKING, Any, final
 
 import strawberry
+from django.utils.translation import gettext_lazy as _
 from strawberry.schema_directive import Location
 from strawberry_django_plus.permissions import ConditionDirective
 
-from gqlauth.core.utils import UserProto
+if TYPE_CHECKING:  # pragma: no cover
+    from gqlauth.core.utils import UserProto
 
 
 @strawberry.schema_directive(
@@ -16,7 +18,7 @@ from gqlauth.core.utils import UserProto
 class IsVerified(ConditionDirective):
     """Mark a field as only resolvable by authenticated users."""
 
-    message: strawberry.Private[str] = dataclasses.field(default="User is not authenticated.")
+    message: strawberry.Private[str] = dataclasses.field(default=_("User is not authenticated."))
 
-    def check_condition(self, root: Any, info, user: UserProto, **kwargs) -> bool:  # type: ignore
+    def check_condition(self, root: Any, info, user: "UserProto", **kwargs) -> bool:  # type: ignore
         return user.is_authenticated and user.status.verified
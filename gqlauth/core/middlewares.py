@@ -60,6 +60,38 @@ def get_user_or_error(scope_or_request: Union[dict, HttpRequest]) -> UserOrError
     return user_or_error
 
 
+def _cached_user_or_error(scope_or_request: Union[dict, HttpRequest]) -> Optional[UserOrError]:
+    if isinstance(scope_or_request, dict):
+        return scope_or_request.get(USER_OR_ERROR_KEY, None)
+    return getattr(scope_or_request, USER_OR_ERROR_KEY, None)
+
+
+def get_cached_user_or_error(scope_or_request: Union[dict, HttpRequest]) -> UserOrError:
+    """Returns the `UserOrError` cached on the request (or channels scope) by
+    the middlewares.
+
+    If there is none (i.e the middleware is not installed) the token is
+    resolved here and cached so that it is decoded only once per request.
+
+    *This might hit the database, use `aget_cached_user_or_error` from async code.*
+    """
+    if not (user_or_error := _cached_user_or_error(scope_or_request)):
+        user_or_error = get_user_or_error(scope_or_request)
+        if isinstance(scope_or_request, dict):
+            scope_or_request[USER_OR_ERROR_KEY] = user_or_error
+        else:
+            setattr(scope_or_request, USER_OR_ERROR_KEY, user_or_error)
+    return user_or_error
+
+
+async def aget_cached_user_or_error(scope_or_request: Union[dict, HttpRequest]) -> UserOrError:
+    """Async version of `get_cached_user_or_error`, the database is only
+    reached (in a thread) if the middleware did not cache a result."""
+    if user_or_error := _cached_user_or_error(scope_or_request):
+        return user_or_error
+    return await sync_to_async(get_cached_user_or_error)(scope_or_request)
+
+
 def channels_jwt_middleware(inner: Callable):
     from channels.auth import (
         login as channels_login,  # deferred import for users that don't use channels.
@@ -107,28 +139,39 @@ def django_jwt_middleware(get_response):
 
 
 class JwtSchema(Schema):
-    """injects token to context."""
+    """injects token to context.
+
+    The user is taken from the django / channels middleware. If the
+    middleware is not installed the token is decoded here, once per
+    request, but the user is **not** logged in (no session / scope
+    user), only `info.context.request.user` is set.
+    """
 
     def execute_sync(self, *args, **kwargs):
-        self._inject_user_and_errors(kwargs)
+        scope_or_request = self._get_scope_or_request(kwargs)
+        self._inject_user(kwargs, get_cached_user_or_error(scope_or_request))
         return super().execute_sync(*args, **kwargs)
 
     async def execute(self, *args, **kwargs):
-        self._inject_user_and_errors(kwargs)
+        scope_or_request = self._get_scope_or_request(kwargs)
+        self._inject_user(kwargs, await aget_cached_user_or_error(scope_or_request))
         return await super().execute(*args, **kwargs)
 
-    def subscribe(self, *args, **kwargs):
-        self._inject_user_and_errors(kwargs)
-        res = super().subscribe(*args, **kwargs)
-        return res
+    async def subscribe(self, *args, **kwargs):
+        scope_or_request = self._get_scope_or_request(kwargs)
+        self._inject_user(kwargs, await aget_cached_user_or_error(scope_or_request))
+        return await super().subscribe(*args, **kwargs)
 
     @staticmethod
-    def _inject_user_and_errors(kwargs: dict) -> UserOrError:
+    def _get_scope_or_request(kwargs: dict) -> Union[dict, HttpRequest]:
         context = kwargs.get("context_value")
         # channels compat
         if ws := getattr(context, "ws", None):
-            user_or_error: UserOrError = ws.scope[USER_OR_ERROR_KEY]
-        else:
-            user_or_error: UserOrError = getattr(context.request, USER_OR_ERROR_KEY)  # type: ignore
-        context.request.user = user_or_error.user  # type: ignore
-        return user_or_error
+            return ws.scope
+        return context.request  # type: ignore
+
+    @staticmethod
+    def _inject_user(kwargs: dict, user_or_error: UserOrError) -> None:
+        context = kwargs.get("context_value")
+        if getattr(context.request, "user", None) is not user_or_error.user:  # type: ignore
+            context.request.user = user_or_error.user  # type: ignore
@@ -111,10 +111,14 @@ class TokenType:
         return token_type
 
     def get_user_instance(self) -> "UserProto":
-        """might raise not existed exception."""
+        """might raise not existed exception.
+
+        The user status is fetched within the same query since directives
+        (e.g. `IsVerified`) read it for every guarded field.
+        """
         pk_name = app_settings.JWT_PAYLOAD_PK.python_name
         query = {pk_name: getattr(self.payload, pk_name)}
-        return USER_MODEL.objects.get(**query)  # type: ignore
+        return USER_MODEL.objects.select_related("status").get(**query)  # type: ignore
 
 
 @strawberry.input
@@ -245,6 +245,10 @@ class GqlAuthSettings:
     *This filed must be unique in the database*
     """
     JWT_DECODE_HANDLER: Callable[[str], "TokenType"] = decode_jwt
+    """A custom function to decode a token string into the token datatype,
+    Defaults to PyJWT. You can replace it with a faster decoder as long as it
+    verifies the signature and raises `jwt.PyJWTError` for invalid tokens.
+    """
 
     JWT_TOKEN_FINDER: Callable[[Union["HttpRequest", dict]], Optional[str]] = token_finder
     """A hook called by `GqlAuthRootField` to find the token. Accepts the
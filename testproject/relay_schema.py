@@ -2,6 +2,7 @@ import strawberry
 from gqlauth.core.middlewares import JwtSchema
 from gqlauth.user import relay
 from gqlauth.user.resolvers import Captcha
+from strawberry.extensions import ParserCache
 from strawberry_django_plus import gql
 from strawberry_django_plus.permissions import IsAuthenticated
 
@@ -38,4 +39,5 @@ class Mutation:
 relay_schema = JwtSchema(
     query=Query,
     mutation=Mutation,
+    extensions=[ParserCache()],
 )
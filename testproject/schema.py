@@ -6,6 +6,7 @@ from gqlauth.core.utils import get_user
 from gqlauth.user import arg_mutations
 from gqlauth.user.arg_mutations import Captcha
 from gqlauth.user.queries import UserQueries
+from strawberry.extensions import ParserCache
 from strawberry.types import Info
 from strawberry_django_plus import gql
 from strawberry_django_plus.directives import SchemaDirectiveExtension
@@ -76,5 +77,8 @@ class Subscription:
 
 
 arg_schema = JwtSchema(
-    query=Query, mutation=Mutation, subscription=Subscription, extensions=[SchemaDirectiveExtension]
+    query=Query,
+    mutation=Mutation,
+    subscription=Subscription,
+    extensions=[SchemaDirectiveExtension, ParserCache()],
 )
@@ -1,7 +1,7 @@
 import dataclasses
 from contextlib import contextmanager
 from dataclasses import asdict, dataclass
-from typing import TYPE_CHECKING, Any, Iterable, NamedTuple, Union
+from typing import TYPE_CHECKING, Any, Iterable, NamedTuple, Optional, Union
 
 import faker
 import pytest
@@ -246,10 +246,13 @@ class SchemaHelper(NamedTuple):
         setattr(context.request, USER_OR_ERROR_KEY, UserOrError(user=user))
         return SchemaHelper(context=context, schema=schema, us_type=us_type)
 
-    def execute(self, query: str, relay: bool = False) -> ExecutionResult:
-        if relay:
-            return relay_schema.execute_sync(query=query, context_value=self.context)
-        return self.schema.execute_sync(query=query, context_value=self.context)
+    def execute(
+        self, query: str, relay: bool = False, variables: Optional[dict] = None
+    ) -> ExecutionResult:
+        schema = relay_schema if relay else self.schema
+        return schema.execute_sync(
+            query=query, variable_values=variables, context_value=self.context
+        )
 
 
 @pytest.fixture()
@@ -1,4 +1,8 @@
+from unittest import mock
+
 from django.contrib.auth import get_user_model
+from django.utils import translation
+from django.utils.translation import trans_real
 from gqlauth.core.directives import IsVerified
 
 USER_MODEL = get_user_model()
@@ -10,3 +14,13 @@ def test_is_verified_fails(db_unverified_user_status):
 
 def test_is_verified_success(db_verified_user_status):
     assert IsVerified().check_condition(None, None, db_verified_user_status.user.obj)
+
+
+def test_is_verified_message_is_translated_per_request():
+    translations = {"User is not authenticated.": "Utilisateur non authentifié."}
+    fr = trans_real.translation("fr")
+    with mock.patch.object(fr, "gettext", side_effect=lambda msg: translations.get(msg, msg)):
+        with translation.override("fr"):
+            assert str(IsVerified().message) == "Utilisateur non authentifié."
+        with translation.override("en"):
+            assert str(IsVerified().message) == "User is not authenticated."
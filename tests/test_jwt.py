@@ -26,3 +26,12 @@ def test_token_expired(db_verified_user_status, app_settings, override_gqlauth):
         with pytest.raises(TokenExpired):
             TokenType.from_token(token.token)
     assert app_settings.JWT_EXPIRATION_DELTA
+
+
+def test_token_user_instance_has_status_prefetched(
+    db_verified_user_status, django_assert_num_queries
+):
+    token = TokenType.from_user(db_verified_user_status.user.obj)
+    with django_assert_num_queries(1):
+        user = token.get_user_instance()
+        assert user.status.verified
@@ -1,6 +1,11 @@
 import pytest
+from django.contrib.auth.models import AnonymousUser
 from gql import Client, gql
 from gql.transport.aiohttp import AIOHTTPTransport
+from gqlauth.core.middlewares import USER_OR_ERROR_KEY, UserOrError
+from testproject.schema import arg_schema
+
+from .conftest import FakeContext
 
 pytestmark = pytest.mark.default_user
 
@@ -68,3 +73,73 @@ async def test_async_middleware(async_client):
         content_type="application/json",
     )
     assert res.json()["data"]["amIAnonymous"] is True
+
+
+def test_jwt_schema_resolves_token_once_without_middleware(
+    rf, db_verified_user_status, app_settings, override_gqlauth
+):
+    calls = []
+    decode_handler = app_settings.JWT_DECODE_HANDLER
+
+    def counting_handler(token: str):
+        calls.append(token)
+        return decode_handler(token)
+
+    req = rf.post(path="/fake", HTTP_AUTHORIZATION=db_verified_user_status.generate_fresh_token())
+    context = FakeContext(request=req)
+    query = "query { whatsMyUserName }"
+    with override_gqlauth(name="JWT_DECODE_HANDLER", replace=counting_handler):
+        res = arg_schema.execute_sync(query=query, context_value=context)
+        assert res.data["whatsMyUserName"] == db_verified_user_status.user.username_field
+        res = arg_schema.execute_sync(query=query, context_value=context)
+        assert not res.errors
+    assert len(calls) == 1
+
+
+async def test_jwt_schema_resolves_token_without_middleware_async(rf, db_verified_user_status):
+    req = rf.post(path="/fake", HTTP_AUTHORIZATION=db_verified_user_status.generate_fresh_token())
+    res = await arg_schema.execute(
+        query="query { whatsMyUserName }", context_value=FakeContext(request=req)
+    )
+    assert not res.errors
+    assert res.data["whatsMyUserName"] == db_verified_user_status.user.username_field
+    assert getattr(req, USER_OR_ERROR_KEY).user == db_verified_user_status.user.obj
+
+
+class UserWriteCountingRequest:
+    def __init__(self, user_or_error: UserOrError):
+        setattr(self, USER_OR_ERROR_KEY, user_or_error)
+        self._user = user_or_error.user
+        self.user_writes = 0
+
+    @property
+    def user(self):
+        return self._user
+
+    @user.setter
+    def user(self, value):
+        self.user_writes += 1
+        self._user = value
+
+
+def test_jwt_schema_skips_writing_unchanged_user(db_verified_user_status):
+    user = db_verified_user_status.user.obj
+    req = UserWriteCountingRequest(UserOrError(user=user))
+    res = arg_schema.execute_sync(
+        query="query { amIAnonymous }", context_value=FakeContext(request=req)
+    )
+    assert res.data["amIAnonymous"] is False
+    assert req.user_writes == 0
+    assert req.user is user
+
+
+def test_jwt_schema_writes_changed_user(db_verified_user_status):
+    user = db_verified_user_status.user.obj
+    req = UserWriteCountingRequest(UserOrError(user=user))
+    req._user = AnonymousUser()
+    res = arg_schema.execute_sync(
+        query="query { amIAnonymous }", context_value=FakeContext(request=req)
+    )
+    assert res.data["amIAnonymous"] is False
+    assert req.user_writes == 1
+    assert req.user is user
@@ -1,32 +1,32 @@
 from gqlauth.core.constants import Messages
 
+REFRESH_TOKEN_QUERY = """
+mutation MyMutation($refreshToken: String!, $revokeRefreshToken: Boolean!) {
+  refreshToken(refreshToken: $refreshToken, revokeRefreshToken: $revokeRefreshToken) {
+    errors
+    token {
+      token
+    }
+    success
+    refreshToken {
+      token
+      revoked
+      isExpired
+      expiresAt
+      created
+    }
+  }
+}
+"""
 
-def _arg_query(token: str, revoke="false"):
-    return """
-    mutation MyMutation {{
-      refreshToken(refreshToken: "{}", revokeRefreshToken: {}) {{
-        errors
-        token {{
-          token
-        }}
-        success
-        refreshToken {{
-          token
-          revoked
-          isExpired
-          expiresAt
-          created
-        }}
-      }}
-    }}
-    """.format(
-        token, revoke
-    )
+
+def _variables(token: str, revoke: bool = False) -> dict:
+    return {"refreshToken": token, "revokeRefreshToken": revoke}
 
 
 def test_refresh_token(db_verified_user_status, anonymous_schema):
-    query = _arg_query(db_verified_user_status.generate_refresh_token().token)
-    executed = anonymous_schema.execute(query=query)
+    variables = _variables(db_verified_user_status.generate_refresh_token().token)
+    executed = anonymous_schema.execute(query=REFRESH_TOKEN_QUERY, variables=variables)
     assert not executed.errors
     executed = executed.data["refreshToken"]
     assert executed["success"]
@@ -36,8 +36,7 @@ def test_refresh_token(db_verified_user_status, anonymous_schema):
 
 
 def test_invalid_token(anonymous_schema, db):
-    query = _arg_query("invalid_token")
-    res = anonymous_schema.execute(query=query)
+    res = anonymous_schema.execute(query=REFRESH_TOKEN_QUERY, variables=_variables("invalid_token"))
     assert not res.errors
     res = res.data["refreshToken"]
     assert not res["success"]
@@ -48,8 +47,8 @@ def test_invalid_token(anonymous_schema, db):
 def test_revoke_refresh_token(anonymous_schema, db_verified_user_status):
     refresh = db_verified_user_status.generate_refresh_token()
     assert not refresh.is_expired_()
-    query = _arg_query(refresh.token, "true")
-    executed = anonymous_schema.execute(query=query)
+    variables = _variables(refresh.token, revoke=True)
+    executed = anonymous_schema.execute(query=REFRESH_TOKEN_QUERY, variables=variables)
     assert not executed.errors
     executed = executed.data["refreshToken"]
     assert executed["success"]
@@ -61,5 +60,5 @@ def test_revoke_refresh_token(anonymous_schema, db_verified_user_status):
     assert refresh.revoked
     assert refresh.is_expired_()
     # try to get a new token with the revoked token
-    executed = anonymous_schema.execute(query=query)
+    executed = anonymous_schema.execute(query=REFRESH_TOKEN_QUERY, variables=variables)
     assert executed.data["refreshToken"]["errors"]["nonFieldErrors"] == Messages.EXPIRED_TOKEN
@@ -1,26 +1,23 @@
-def _arg_query(token: str):
-    return """
-    mutation MyMutation {
-      revokeToken(refreshToken: "%s") {
-        errors
-        success
-        refreshToken {
-          created
-          expiresAt
-          isExpired
-          revoked
-          token
-        }
-      }
+REVOKE_TOKEN_QUERY = """
+mutation MyMutation($refreshToken: String!) {
+  revokeToken(refreshToken: $refreshToken) {
+    errors
+    success
+    refreshToken {
+      created
+      expiresAt
+      isExpired
+      revoked
+      token
     }
-    """ % (
-        token
-    )
+  }
+}
+"""
 
 
 def test_revoke_token(db_verified_user_status, anonymous_schema):
-    query = _arg_query(db_verified_user_status.generate_refresh_token().token)
-    res = anonymous_schema.execute(query=query)
+    token = db_verified_user_status.generate_refresh_token().token
+    res = anonymous_schema.execute(query=REVOKE_TOKEN_QUERY, variables={"refreshToken": token})
     assert not res.errors
     res = res.data["revokeToken"]
     assert res["success"]
@@ -30,8 +27,9 @@ def test_revoke_token(db_verified_user_status, anonymous_schema):
 
 
 def test_invalid_token(db_verified_user_status, anonymous_schema):
-    query = _arg_query("invalid_token")
-    res = anonymous_schema.execute(query=query)
+    res = anonymous_schema.execute(
+        query=REVOKE_TOKEN_QUERY, variables={"refreshToken": "invalid_token"}
+    )
     assert not res.errors
     res = res.data["revokeToken"]
 
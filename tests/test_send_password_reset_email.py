@@ -2,12 +2,16 @@ from smtplib import SMTPException
 from unittest import mock
 
 import pytest
+from django.contrib.auth import get_user_model
 from gqlauth.core.constants import Messages
+from gqlauth.core.utils import get_user_by_email
 
 from .conftest import UserType
 
 pytestmark = pytest.mark.default_user
 
+UserModel = get_user_model()
+
 
 def _arg_query(user: UserType):
     return """
@@ -66,3 +70,10 @@ def test_send_email_fail_to_send_email(db_verified_user_status, anonymous_schema
     executed = executed.data["sendPasswordResetEmail"]
     assert not executed["success"]
     assert executed["errors"]["nonFieldErrors"] == Messages.EMAIL_FAIL
+
+
+def test_user_by_email_has_status_prefetched(db_verified_user_status, django_assert_num_queries):
+    email = getattr(db_verified_user_status.user.obj, UserModel.EMAIL_FIELD)
+    with django_assert_num_queries(1):
+        user = get_user_by_email(email)
+        assert user.status.verified